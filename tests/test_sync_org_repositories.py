@@ -117,6 +117,15 @@ class TestValidateGithubApiRequest:
             is True
         )
 
+    def test_allowed_post_graphql(self):
+        assert (
+            sync_module.validate_github_api_request(f"{GITHUB_API}/graphql", "POST") is True
+        )
+
+    def test_disallowed_get_graphql(self):
+        result = sync_module.validate_github_api_request(f"{GITHUB_API}/graphql", "GET")
+        assert not result
+
 
 class TestValidateBranchName:
     """Tests for validate_branch_name."""
@@ -405,6 +414,526 @@ class TestCheckExistingSyncPr:
         assert kwargs["params"]["per_page"] == 100
 
 
+class TestEtagCaching:
+    """Tests for ETag conditional-request caching in github_api_request."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_cache(self):
+        sync_module._etag_cache.clear()
+        yield
+        sync_module._etag_cache.clear()
+
+    def _make_response(self, status, body=None, headers=None):
+        from unittest.mock import Mock
+
+        response = Mock()
+        response.status_code = status
+        response.headers = headers or {}
+        response.json.return_value = body if body is not None else {}
+        response.text = ""
+        return response
+
+    def test_cache_key_includes_params(self):
+        url = f"{GITHUB_API}/repos/org/repo/pulls"
+        bare = sync_module._etag_cache_key(url, None)
+        with_params = sync_module._etag_cache_key(url, {"state": "open"})
+        assert bare == url
+        assert with_params != bare
+        assert "state=open" in with_params
+
+    def test_etag_stored_on_200(self):
+        url = f"{GITHUB_API}/repos/org/repo"
+        response = self._make_response(
+            200, body={"name": "repo"}, headers={"ETag": 'W/"abc"'},
+        )
+        with patch.object(
+            sync_module._get_session(), "request", return_value=response,
+        ):
+            status, data = sync_module.github_api_request(url)
+        assert status == 200
+        assert data == {"name": "repo"}
+        assert sync_module._etag_cache[url] == ['W/"abc"', {"name": "repo"}]
+
+    def test_304_served_from_cache(self):
+        url = f"{GITHUB_API}/repos/org/repo"
+        sync_module._etag_cache[url] = ['W/"abc"', {"name": "cached"}]
+        response = self._make_response(304)
+        with patch.object(
+            sync_module._get_session(), "request", return_value=response,
+        ) as mock_request:
+            status, data = sync_module.github_api_request(url)
+        assert status == 200
+        assert data == {"name": "cached"}
+        _, kwargs = mock_request.call_args
+        assert kwargs["headers"]["If-None-Match"] == 'W/"abc"'
+
+    def test_post_not_cached(self):
+        url = f"{GITHUB_API}/repos/org/repo/pulls"
+        response = self._make_response(
+            201, body={"html_url": "x"}, headers={"ETag": 'W/"abc"'},
+        )
+        with patch.object(
+            sync_module._get_session(), "request", return_value=response,
+        ):
+            sync_module.github_api_request(url, method="POST", data={})
+        assert url not in sync_module._etag_cache
+
+
+class TestRateLimiter:
+    """Tests for the _RateLimiter backoff helper."""
+
+    def test_no_wait_with_budget_remaining(self):
+        limiter = sync_module._RateLimiter(min_budget=50)
+        limiter.update(
+            {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "0"},
+        )
+        with patch.object(sync_module.time, "sleep") as mock_sleep:
+            limiter.maybe_wait()
+        mock_sleep.assert_not_called()
+
+    def test_waits_until_reset_when_budget_low(self):
+        limiter = sync_module._RateLimiter(min_budget=50)
+        limiter.update(
+            {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "1100"},
+        )
+        with patch.object(sync_module.time, "time", return_value=1000.0):
+            with patch.object(sync_module.time, "sleep") as mock_sleep:
+                limiter.maybe_wait()
+        mock_sleep.assert_called_once_with(100.0)
+
+    def test_no_wait_after_reset_passed(self):
+        limiter = sync_module._RateLimiter(min_budget=50)
+        limiter.update(
+            {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "900"},
+        )
+        with patch.object(sync_module.time, "time", return_value=1000.0):
+            with patch.object(sync_module.time, "sleep") as mock_sleep:
+                limiter.maybe_wait()
+        mock_sleep.assert_not_called()
+
+    def test_malformed_headers_ignored(self):
+        limiter = sync_module._RateLimiter(min_budget=50)
+        limiter.update(
+            {"X-RateLimit-Remaining": "bogus", "X-RateLimit-Reset": "0"},
+        )
+        with patch.object(sync_module.time, "sleep") as mock_sleep:
+            limiter.maybe_wait()
+        mock_sleep.assert_not_called()
+
+    def test_retry_after_honored_once(self):
+        from unittest.mock import Mock
+
+        limited = Mock()
+        limited.status_code = 403
+        limited.headers = {"Retry-After": "2"}
+        limited.json.return_value = {"message": "rate limited"}
+        limited.text = ""
+
+        ok = Mock()
+        ok.status_code = 200
+        ok.headers = {}
+        ok.json.return_value = {"name": "repo"}
+        ok.text = ""
+
+        url = f"{GITHUB_API}/repos/org/repo"
+        with patch.object(
+            sync_module._get_session(), "request", side_effect=[limited, ok],
+        ) as mock_request:
+            with patch.object(sync_module.time, "sleep") as mock_sleep:
+                status, data = sync_module.github_api_request(url)
+        assert status == 200
+        assert data == {"name": "repo"}
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+
+
+class TestSessionConfiguration:
+    """Tests for the shared HTTP session."""
+
+    def test_static_headers_set_once(self):
+        headers = sync_module._get_session().headers
+        assert headers["Accept"] == "application/vnd.github+json"
+        assert headers["X-GitHub-Api-Version"] == "2022-11-28"
+        assert headers["Authorization"].startswith("Bearer ")
+
+    def test_adapter_retries_transient_errors(self):
+        adapter = sync_module._get_session().get_adapter("https://api.github.com")
+        retry = adapter.max_retries
+        assert retry.total == 5
+        assert 502 in retry.status_forcelist
+        assert 503 in retry.status_forcelist
+        assert 504 in retry.status_forcelist
+
+    def test_non_idempotent_methods_not_retried(self):
+        adapter = sync_module._get_session().get_adapter("https://api.github.com")
+        allowed = {m.upper() for m in adapter.max_retries.allowed_methods}
+        assert "POST" not in allowed
+        assert "GET" in allowed
+
+    def test_session_is_shared_across_calls(self):
+        assert sync_module._get_session() is sync_module._get_session()
+
+
+class TestLazyImports:
+    """Importing the module must not pull in the heavy dependencies."""
+
+    def test_module_import_defers_heavy_dependencies(self):
+        import subprocess
+
+        code = (
+            "import importlib, sys; "
+            "sys.path.insert(0, 'scripts'); "
+            "importlib.import_module('sync-org-repositories'); "
+            "heavy = [m for m in ('yaml', 'requests', 'git') "
+            "if m in sys.modules]; "
+            "sys.exit(1 if heavy else 0)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(Path(__file__).parent.parent),
+        )
+        assert result.returncode == 0
+
+
+class TestFetchDefaultBranches:
+    """Tests for fetch_default_branches."""
+
+    @patch.object(sync_module, "graphql_query")
+    def test_maps_repos_to_branches(self, mock_gql):
+        mock_gql.return_value = (
+            200,
+            {
+                "data": {
+                    "r0": {"defaultBranchRef": {"name": "main"}},
+                    "r1": {"defaultBranchRef": {"name": "master"}},
+                },
+            },
+        )
+        result = sync_module.fetch_default_branches("org", ["repo-a", "repo-b"])
+        assert result == {"repo-a": "main", "repo-b": "master"}
+        assert mock_gql.call_count == 1
+
+    @patch.object(sync_module, "graphql_query")
+    def test_missing_repo_omitted(self, mock_gql):
+        mock_gql.return_value = (
+            200,
+            {
+                "data": {
+                    "r0": {"defaultBranchRef": {"name": "main"}},
+                    "r1": None,
+                },
+            },
+        )
+        result = sync_module.fetch_default_branches("org", ["repo-a", "gone"])
+        assert result == {"repo-a": "main"}
+        assert "gone" not in result
+
+    @patch.object(sync_module, "graphql_query")
+    def test_empty_default_branch_ref_omitted(self, mock_gql):
+        # Empty repos have no defaultBranchRef
+        mock_gql.return_value = (
+            200,
+            {"data": {"r0": {"defaultBranchRef": None}}},
+        )
+        result = sync_module.fetch_default_branches("org", ["empty-repo"])
+        assert result == {}
+
+    @patch.object(sync_module, "graphql_query")
+    def test_query_failure_returns_empty(self, mock_gql):
+        mock_gql.return_value = (500, {"error": "internal"})
+        result = sync_module.fetch_default_branches("org", ["repo-a"])
+        assert result == {}
+
+    @patch.object(sync_module, "graphql_query")
+    def test_batches_large_repo_lists(self, mock_gql):
+        batch = sync_module.GRAPHQL_BATCH_SIZE
+        repos = [f"repo-{n}" for n in range(batch + 1)]
+
+        def fake_query(query):
+            count = query.count("repository(")
+            return (
+                200,
+                {
+                    "data": {
+                        f"r{i}": {"defaultBranchRef": {"name": "main"}}
+                        for i in range(count)
+                    },
+                },
+            )
+
+        mock_gql.side_effect = fake_query
+        result = sync_module.fetch_default_branches("org", repos)
+        assert len(result) == batch + 1
+        assert mock_gql.call_count == 2
+
+    @patch.object(sync_module, "graphql_query")
+    def test_no_repos_no_query(self, mock_gql):
+        result = sync_module.fetch_default_branches("org", [])
+        assert result == {}
+        mock_gql.assert_not_called()
+
+
+class TestFindOpenSyncPrs:
+    """Tests for find_open_sync_prs."""
+
+    @patch.object(sync_module, "graphql_query")
+    def test_matching_pr_found(self, mock_gql):
+        mock_gql.return_value = (
+            200,
+            {
+                "data": {
+                    "r0": {
+                        "pullRequests": {
+                            "nodes": [
+                                {
+                                    "title": "chore: sync repository standards",
+                                    "url": "https://github.com/org/repo-a/pull/7",
+                                    "headRefName": "sync-repo-standards-20260416120000",
+                                },
+                            ],
+                        },
+                    },
+                    "r1": {"pullRequests": {"nodes": []}},
+                },
+            },
+        )
+        result = sync_module.find_open_sync_prs("org", ["repo-a", "repo-b"])
+        assert result == {
+            "repo-a": {
+                "url": "https://github.com/org/repo-a/pull/7",
+                "branch": "sync-repo-standards-20260416120000",
+            },
+        }
+
+    @patch.object(sync_module, "graphql_query")
+    def test_non_matching_titles_ignored(self, mock_gql):
+        mock_gql.return_value = (
+            200,
+            {
+                "data": {
+                    "r0": {
+                        "pullRequests": {
+                            "nodes": [
+                                {
+                                    "title": "feat: something else",
+                                    "url": "https://github.com/org/repo-a/pull/1",
+                                    "headRefName": "feat/x",
+                                },
+                            ],
+                        },
+                    },
+                },
+            },
+        )
+        result = sync_module.find_open_sync_prs("org", ["repo-a"])
+        assert result == {}
+
+    @patch.object(sync_module, "graphql_query")
+    def test_query_failure_returns_none(self, mock_gql):
+        mock_gql.return_value = (502, {"error": "bad gateway"})
+        result = sync_module.find_open_sync_prs("org", ["repo-a"])
+        assert result is None
+
+    @patch.object(sync_module, "graphql_query")
+    def test_missing_repo_treated_as_no_pr(self, mock_gql):
+        mock_gql.return_value = (200, {"data": {"r0": None}})
+        result = sync_module.find_open_sync_prs("org", ["gone"])
+        assert result == {}
+
+    @patch.object(sync_module, "graphql_query")
+    def test_query_window_matches_rest_fallback(self, mock_gql):
+        mock_gql.return_value = (
+            200, {"data": {"r0": {"pullRequests": {"nodes": []}}}},
+        )
+        sync_module.find_open_sync_prs("org", ["repo-a"])
+        query = mock_gql.call_args[0][0]
+        assert "first: 100" in query
+        assert "field: UPDATED_AT, direction: DESC" in query
+
+
+class TestGitBlobSha:
+    """Tests for _git_blob_sha."""
+
+    def test_empty_blob_matches_git(self):
+        # git hash-object on /dev/null — well-known constant.
+        assert (
+            sync_module._git_blob_sha(b"")
+            == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+        )
+
+    def test_content_blob_matches_git(self):
+        import subprocess
+
+        data = b"sync test content\n"
+        expected = subprocess.run(
+            ["git", "hash-object", "--stdin"],
+            input=data,
+            capture_output=True,
+            check=True,
+        ).stdout.decode().strip()
+        assert sync_module._git_blob_sha(data) == expected
+
+
+class TestFetchUpstreamFileStates:
+    """Tests for fetch_upstream_file_states."""
+
+    def test_returns_oids_and_dependabot_text(self):
+        response = {
+            "data": {
+                "r0": {
+                    "f0": {"oid": "a" * 40},
+                    "dependabot": {"oid": "b" * 40, "text": "version: 2\n"},
+                },
+            },
+        }
+        with patch.object(
+            sync_module, "graphql_query", return_value=(200, response),
+        ) as gq:
+            states = sync_module.fetch_upstream_file_states(
+                "test-org", ["repo-a"], ["SECURITY.md"],
+            )
+        assert states == {
+            "repo-a": {
+                "oids": {
+                    "SECURITY.md": "a" * 40,
+                    ".github/dependabot.yml": "b" * 40,
+                },
+                "dependabot_text": "version: 2\n",
+            },
+        }
+        query = gq.call_args[0][0]
+        assert '"HEAD:SECURITY.md"' in query
+        assert '"HEAD:.github/dependabot.yml"' in query
+
+    def test_missing_files_yield_none_oids(self):
+        response = {"data": {"r0": {"f0": None, "dependabot": None}}}
+        with patch.object(
+            sync_module, "graphql_query", return_value=(200, response),
+        ):
+            states = sync_module.fetch_upstream_file_states(
+                "test-org", ["repo-a"], ["SECURITY.md"],
+            )
+        assert states["repo-a"]["oids"]["SECURITY.md"] is None
+        assert states["repo-a"]["dependabot_text"] is None
+
+    def test_query_failure_returns_none(self):
+        with patch.object(
+            sync_module, "graphql_query", return_value=(500, {}),
+        ):
+            assert (
+                sync_module.fetch_upstream_file_states(
+                    "test-org", ["repo-a"], ["SECURITY.md"],
+                )
+                is None
+            )
+
+
+class TestUpstreamMatchesSources:
+    """Tests for upstream_matches_sources."""
+
+    def _security_md_sha(self):
+        data = (Path(__file__).parent.parent / "SECURITY.md").read_bytes()
+        return sync_module._git_blob_sha(data)
+
+    def test_all_files_match(self):
+        config = {"files_to_sync": [{"source": "SECURITY.md"}]}
+        state = {
+            "oids": {"SECURITY.md": self._security_md_sha()},
+            "dependabot_text": None,
+        }
+        assert (
+            sync_module.upstream_matches_sources(
+                "test-org", "repo-a", config, state,
+            )
+            is True
+        )
+
+    def test_differing_oid_fails(self):
+        config = {"files_to_sync": [{"source": "SECURITY.md"}]}
+        state = {"oids": {"SECURITY.md": "0" * 40}, "dependabot_text": None}
+        assert (
+            sync_module.upstream_matches_sources(
+                "test-org", "repo-a", config, state,
+            )
+            is False
+        )
+
+    def test_missing_upstream_file_fails(self):
+        config = {"files_to_sync": [{"source": "SECURITY.md"}]}
+        state = {"oids": {}, "dependabot_text": None}
+        assert (
+            sync_module.upstream_matches_sources(
+                "test-org", "repo-a", config, state,
+            )
+            is False
+        )
+
+    def test_excluded_file_is_ignored(self):
+        config = {
+            "files_to_sync": [
+                {"source": "SECURITY.md", "exclude_repos": ["repo-a"]},
+            ],
+        }
+        state = {"oids": {}, "dependabot_text": None}
+        assert (
+            sync_module.upstream_matches_sources(
+                "test-org", "repo-a", config, state,
+            )
+            is True
+        )
+
+    def test_dependabot_rendering_compared(self):
+        config = {
+            "files_to_sync": [],
+            "dependabot": {
+                "common": [
+                    {"package-ecosystem": "gomod", "directory": "/"},
+                ],
+            },
+        }
+        rendered = sync_module.render_dependabot_config(
+            sync_module.generate_dependabot_config("repo-a", config), "",
+        )
+        matching = {
+            "oids": {
+                ".github/dependabot.yml": sync_module._git_blob_sha(
+                    rendered.encode(),
+                ),
+            },
+            "dependabot_text": None,
+        }
+        stale = {"oids": {".github/dependabot.yml": "0" * 40}, "dependabot_text": None}
+        assert (
+            sync_module.upstream_matches_sources(
+                "test-org", "repo-a", config, matching,
+            )
+            is True
+        )
+        assert (
+            sync_module.upstream_matches_sources(
+                "test-org", "repo-a", config, stale,
+            )
+            is False
+        )
+
+    def test_sync_repository_skips_clone_on_match(self):
+        with patch.object(
+            sync_module, "upstream_matches_sources", return_value=True,
+        ), patch.object(
+            sync_module,
+            "clone_for_sync",
+            side_effect=AssertionError("clone should be skipped"),
+        ):
+            result = sync_module.sync_repository(
+                "test-org",
+                "repo-a",
+                {"files_to_sync": []},
+                dry_run=True,
+                upstream_lookup={"repo-a": {"oids": {}}},
+            )
+        assert result["status"] == "up_to_date"
+
+
 class TestCompareFiles:
     """Tests for compare_files."""
 
@@ -427,6 +956,24 @@ class TestCompareFiles:
         f1.write_text("hello")
         assert sync_module.compare_files(str(f1), str(tmp_path / "missing.txt")) is False
 
+    def test_same_size_different_content(self, tmp_path):
+        f1 = tmp_path / "a.txt"
+        f2 = tmp_path / "b.txt"
+        f1.write_text("aaaa")
+        f2.write_text("bbbb")
+        assert sync_module.compare_files(str(f1), str(f2)) is False
+
+    def test_source_read_cached_across_comparisons(self, tmp_path):
+        src = tmp_path / "source.txt"
+        src.write_text("shared content")
+        hits_before = sync_module._source_digest.cache_info().hits
+        for n in range(3):
+            dest = tmp_path / f"dest-{n}.txt"
+            dest.write_text("shared content")
+            assert sync_module.compare_files(str(src), str(dest)) is True
+        hits_after = sync_module._source_digest.cache_info().hits
+        assert hits_after >= hits_before + 2
+
 
 class TestSyncFile:
     """Tests for sync_file."""
@@ -457,6 +1004,398 @@ class TestSyncFile:
         assert result is True
         assert dest.read_text() == "new"
 
+    def test_repeated_syncs_share_staged_inode(self, tmp_path):
+        import os
+
+        src = tmp_path / "src.yml"
+        src.write_text("shared")
+        dest_a = tmp_path / "repo-a" / "file.yml"
+        dest_b = tmp_path / "repo-b" / "file.yml"
+        assert sync_module.sync_file(str(src), str(dest_a), "file.yml") is True
+        assert sync_module.sync_file(str(src), str(dest_b), "file.yml") is True
+        assert dest_a.read_text() == "shared"
+        assert dest_b.read_text() == "shared"
+        if os.stat(dest_a).st_dev == os.stat(dest_b).st_dev:
+            # Hardlink fast path: both destinations point at the
+            # single staged copy.
+            assert os.stat(dest_a).st_ino == os.stat(dest_b).st_ino
+        # Source file is never part of the shared inode.
+        assert os.stat(src).st_ino != os.stat(dest_a).st_ino
+
+    def test_racing_restage_never_rewrites_linked_inode(self, tmp_path):
+        import os
+
+        src = tmp_path / "src.yml"
+        src.write_text("full content\n")
+        # Call the undecorated function twice to model two workers
+        # racing past the lru_cache on the same source.
+        staged = sync_module._staged_source.__wrapped__(str(src))
+        link = tmp_path / "dest.yml"
+        os.link(staged, str(link))
+
+        restaged = sync_module._staged_source.__wrapped__(str(src))
+
+        assert restaged == staged
+        # The re-stage must land as a fresh inode via rename; writing
+        # through the staged path would truncate the linked copy
+        # mid-hash for any worker that already hardlinked it.
+        assert not os.path.samefile(str(link), restaged)
+        assert link.read_text() == "full content\n"
+
+
+class TestCloneForSync:
+    """Tests for clone_for_sync."""
+
+    def _make_origin(self, tmp_path):
+        import subprocess
+
+        origin = tmp_path / "origin"
+        workflows = origin / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "ci_checks.yml").write_text("name: ci\n")
+        (origin / "SECURITY.md").write_text("security\n")
+        (origin / "docs").mkdir()
+        (origin / "docs" / "guide.md").write_text("guide\n")
+        subprocess.run(
+            ["git", "init", "-q", "-b", "main", str(origin)], check=True,
+        )
+        subprocess.run(
+            ["git", "-C", str(origin), "add", "-A"], check=True,
+        )
+        subprocess.run(
+            [
+                "git", "-C", str(origin),
+                "-c", "user.email=test@example.com",
+                "-c", "user.name=test",
+                "commit", "-q", "-m", "initial",
+            ],
+            check=True,
+        )
+        return origin
+
+    def test_clone_contains_synced_paths(self, tmp_path):
+        origin = self._make_origin(tmp_path)
+        clone_path = tmp_path / "clone"
+        files_to_sync = [
+            {"source": ".github/workflows/ci_checks.yml"},
+            {"source": "SECURITY.md"},
+        ]
+        sync_module.clone_for_sync(
+            str(origin), str(clone_path), files_to_sync,
+        )
+        # Synced paths and root-level files must be present in the
+        # working tree regardless of whether the sparse fast path or
+        # the full-clone fallback was taken.
+        assert (clone_path / ".github" / "workflows" / "ci_checks.yml").exists()
+        assert (clone_path / "SECURITY.md").exists()
+
+    def test_clone_supports_commit_and_branch(self, tmp_path):
+        origin = self._make_origin(tmp_path)
+        clone_path = tmp_path / "clone"
+        sync_module.clone_for_sync(
+            str(origin), str(clone_path), [{"source": "SECURITY.md"}],
+        )
+        from git.repo import Repo
+
+        repo = Repo(str(clone_path))
+        repo.git.checkout("-b", "sync-repo-standards-test")
+        (clone_path / "SECURITY.md").write_text("updated\n")
+        repo.git.add("SECURITY.md")
+        repo.index.commit("test commit")
+        assert repo.active_branch.name == "sync-repo-standards-test"
+
+
+class TestCheckoutPrBranch:
+    """Tests for checkout_pr_branch."""
+
+    def _make_origin_with_pr_branch(self, tmp_path):
+        import subprocess
+
+        origin = tmp_path / "origin"
+        origin.mkdir()
+        (origin / "SECURITY.md").write_text("security\n")
+        subprocess.run(
+            ["git", "init", "-q", "-b", "main", str(origin)], check=True,
+        )
+        subprocess.run(["git", "-C", str(origin), "add", "-A"], check=True)
+        commit_env = [
+            "-c", "user.email=test@example.com",
+            "-c", "user.name=test",
+        ]
+        subprocess.run(
+            ["git", "-C", str(origin), *commit_env, "commit", "-q", "-m", "initial"],
+            check=True,
+        )
+        subprocess.run(
+            [
+                "git", "-C", str(origin),
+                "checkout", "-q", "-b", "sync-repo-standards-pr",
+            ],
+            check=True,
+        )
+        (origin / "SECURITY.md").write_text("pr branch content\n")
+        subprocess.run(["git", "-C", str(origin), "add", "-A"], check=True)
+        subprocess.run(
+            ["git", "-C", str(origin), *commit_env, "commit", "-q", "-m", "pr update"],
+            check=True,
+        )
+        subprocess.run(
+            ["git", "-C", str(origin), "checkout", "-q", "main"], check=True,
+        )
+        return origin
+
+    def test_checkout_after_shallow_single_branch_clone(self, tmp_path):
+        from git.repo import Repo
+
+        origin = self._make_origin_with_pr_branch(tmp_path)
+        clone_path = tmp_path / "clone"
+        # file:// forces the real transport so --depth (and its
+        # implied --single-branch) take effect like they do against
+        # GitHub — a plain local-path clone silently ignores them.
+        sync_module.clone_for_sync(
+            f"file://{origin}", str(clone_path), [{"source": "SECURITY.md"}],
+        )
+
+        sync_module.checkout_pr_branch(str(clone_path), "sync-repo-standards-pr")
+
+        repo = Repo(str(clone_path))
+        assert repo.active_branch.name == "sync-repo-standards-pr"
+        assert (clone_path / "SECURITY.md").read_text() == "pr branch content\n"
+
+
+class TestCreateBranchAndCommit:
+    """Tests for create_branch_and_commit."""
+
+    def _make_clone_with_origin(self, tmp_path):
+        import subprocess
+
+        origin = tmp_path / "origin"
+        origin.mkdir()
+        (origin / "a.txt").write_text("a\n")
+        (origin / "b.txt").write_text("b\n")
+        subprocess.run(
+            ["git", "init", "-q", "-b", "main", str(origin)], check=True,
+        )
+        subprocess.run(["git", "-C", str(origin), "add", "-A"], check=True)
+        subprocess.run(
+            [
+                "git", "-C", str(origin),
+                "-c", "user.email=test@example.com",
+                "-c", "user.name=test",
+                "commit", "-q", "-m", "initial",
+            ],
+            check=True,
+        )
+        clone = tmp_path / "clone"
+        subprocess.run(
+            ["git", "clone", "-q", str(origin), str(clone)], check=True,
+        )
+        subprocess.run(
+            [
+                "git", "-C", str(clone),
+                "config", "user.email", "test@example.com",
+            ],
+            check=True,
+        )
+        subprocess.run(
+            ["git", "-C", str(clone), "config", "user.name", "test"],
+            check=True,
+        )
+        return origin, clone
+
+    def test_stages_all_files_in_one_commit(self, tmp_path):
+        from git.repo import Repo
+
+        origin, clone = self._make_clone_with_origin(tmp_path)
+        (clone / "a.txt").write_text("a updated\n")
+        (clone / "b.txt").write_text("b updated\n")
+
+        result = sync_module.create_branch_and_commit(
+            str(clone),
+            "sync-repo-standards-test",
+            ["a.txt", "b.txt"],
+            "chore: sync repository standards",
+        )
+        assert result is True
+
+        origin_repo = Repo(str(origin))
+        branch_commit = origin_repo.commit("sync-repo-standards-test")
+        assert (
+            branch_commit.tree["a.txt"].data_stream.read() == b"a updated\n"
+        )
+        assert (
+            branch_commit.tree["b.txt"].data_stream.read() == b"b updated\n"
+        )
+
+    def test_invalid_branch_name_rejected(self, tmp_path):
+        _, clone = self._make_clone_with_origin(tmp_path)
+        result = sync_module.create_branch_and_commit(
+            str(clone), "feature/bad", ["a.txt"], "msg",
+        )
+        assert result is False
+
+
+class TestSetupGitCredentials:
+    """Tests for setup_git_credentials."""
+
+    def _make_repo(self, tmp_path):
+        import subprocess
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+        subprocess.run(
+            ["git", "init", "-q", "-b", "main", str(repo_path)], check=True,
+        )
+        return repo_path
+
+    def test_updates_existing_origin_url(self, tmp_path):
+        import subprocess
+
+        from git.repo import Repo
+
+        repo_path = self._make_repo(tmp_path)
+        subprocess.run(
+            [
+                "git", "-C", str(repo_path),
+                "remote", "add", "origin",
+                "https://github.com/test-org/test-repo.git",
+            ],
+            check=True,
+        )
+
+        sync_module.setup_git_credentials(str(repo_path), "test-org", "test-repo")
+
+        url = Repo(str(repo_path)).remote("origin").url
+        assert url.startswith("https://x-access-token:")
+        assert url.endswith("github.com/test-org/test-repo.git")
+
+    def test_creates_origin_when_missing(self, tmp_path):
+        from git.repo import Repo
+
+        repo_path = self._make_repo(tmp_path)
+
+        sync_module.setup_git_credentials(str(repo_path), "test-org", "test-repo")
+
+        url = Repo(str(repo_path)).remote("origin").url
+        assert url.endswith("github.com/test-org/test-repo.git")
+
+
+class TestPrepareWorktreeFromMirror:
+    """Tests for prepare_worktree_from_mirror."""
+
+    def _make_origin(self, tmp_path):
+        import subprocess
+
+        origin = tmp_path / "origin"
+        origin.mkdir()
+        (origin / "SECURITY.md").write_text("security\n")
+        subprocess.run(
+            ["git", "init", "-q", "-b", "main", str(origin)], check=True,
+        )
+        subprocess.run(["git", "-C", str(origin), "add", "-A"], check=True)
+        subprocess.run(
+            [
+                "git", "-C", str(origin),
+                "-c", "user.email=test@example.com",
+                "-c", "user.name=test",
+                "commit", "-q", "-m", "initial",
+            ],
+            check=True,
+        )
+        return origin
+
+    def test_first_run_creates_mirror_and_worktree(self, tmp_path):
+        origin = self._make_origin(tmp_path)
+        cache_dir = tmp_path / "cache"
+        worktree = tmp_path / "work" / "repo"
+        sync_module.prepare_worktree_from_mirror(
+            str(origin), str(cache_dir), "repo", "main", str(worktree),
+        )
+        assert (cache_dir / "mirrors" / "repo.git").exists()
+        assert (worktree / "SECURITY.md").read_text() == "security\n"
+
+    def test_second_run_fetches_new_commits(self, tmp_path):
+        import subprocess
+
+        origin = self._make_origin(tmp_path)
+        cache_dir = tmp_path / "cache"
+
+        worktree1 = tmp_path / "work1" / "repo"
+        sync_module.prepare_worktree_from_mirror(
+            str(origin), str(cache_dir), "repo", "main", str(worktree1),
+        )
+        # Simulate the throwaway tempdir being deleted between runs.
+        import shutil
+
+        shutil.rmtree(worktree1.parent)
+
+        (origin / "SECURITY.md").write_text("updated\n")
+        subprocess.run(["git", "-C", str(origin), "add", "-A"], check=True)
+        subprocess.run(
+            [
+                "git", "-C", str(origin),
+                "-c", "user.email=test@example.com",
+                "-c", "user.name=test",
+                "commit", "-q", "-m", "update",
+            ],
+            check=True,
+        )
+
+        worktree2 = tmp_path / "work2" / "repo"
+        sync_module.prepare_worktree_from_mirror(
+            str(origin), str(cache_dir), "repo", "main", str(worktree2),
+        )
+        assert (worktree2 / "SECURITY.md").read_text() == "updated\n"
+
+    def test_commit_and_push_lands_on_origin(self, tmp_path):
+        import subprocess
+
+        from git.repo import Repo
+
+        origin = self._make_origin(tmp_path)
+        cache_dir = tmp_path / "cache"
+        worktree = tmp_path / "work" / "repo"
+        sync_module.prepare_worktree_from_mirror(
+            str(origin), str(cache_dir), "repo", "main", str(worktree),
+        )
+        for key, value in (
+            ("user.email", "test@example.com"),
+            ("user.name", "test"),
+        ):
+            subprocess.run(
+                ["git", "-C", str(worktree), "config", key, value],
+                check=True,
+            )
+        (worktree / "SECURITY.md").write_text("changed\n")
+
+        result = sync_module.create_branch_and_commit(
+            str(worktree),
+            "sync-repo-standards-cache",
+            ["SECURITY.md"],
+            "chore: sync repository standards",
+        )
+        assert result is True
+
+        origin_repo = Repo(str(origin))
+        branch_commit = origin_repo.commit("sync-repo-standards-cache")
+        assert (
+            branch_commit.tree["SECURITY.md"].data_stream.read()
+            == b"changed\n"
+        )
+
+    def test_credentials_stay_out_of_cache_config(self, tmp_path):
+        origin = self._make_origin(tmp_path)
+        cache_dir = tmp_path / "cache"
+        worktree = tmp_path / "work" / "repo"
+        sync_module.prepare_worktree_from_mirror(
+            str(origin), str(cache_dir), "repo", "main", str(worktree),
+        )
+        with patch.object(sync_module, "GITHUB_TOKEN", "tok-secret"):
+            sync_module.setup_git_credentials(str(worktree), "test-org", "repo")
+        assert "tok-secret" in (worktree / ".git" / "config").read_text()
+        mirror_config = cache_dir / "mirrors" / "repo.git" / "config"
+        assert "tok-secret" not in mirror_config.read_text()
+
 
 class TestLoadSyncConfig:
     """Tests for load_sync_config."""
@@ -479,6 +1418,24 @@ class TestLoadSyncConfig:
         assert len(dependabot["common"]) > 0
 
 
+class TestFilterMissingSources:
+    """Tests for filter_missing_sources."""
+
+    def test_keeps_existing_sources(self):
+        config = sync_module.load_sync_config("sync-config.yml")
+        files_to_sync = config["files_to_sync"]
+        assert sync_module.filter_missing_sources(files_to_sync) == files_to_sync
+
+    def test_drops_missing_sources_with_warning(self, capsys):
+        files_to_sync = [
+            {"source": "SECURITY.md"},
+            {"source": "does-not-exist.yml"},
+        ]
+        kept = sync_module.filter_missing_sources(files_to_sync)
+        assert kept == [{"source": "SECURITY.md"}]
+        assert "does-not-exist.yml" in capsys.readouterr().out
+
+
 class TestSecurityMdSync:
     """Tests for SECURITY.md sync configuration and content."""
 
@@ -544,6 +1501,59 @@ class TestSecurityMdSync:
         assert "community/blob/main/SECURITY.md" in content
 
 
+class TestFetchPeribolosFile:
+    """Tests for fetch_peribolos_file."""
+
+    def _make_response(self, status, text=""):
+        from unittest.mock import Mock
+
+        response = Mock()
+        response.status_code = status
+        response.text = text
+        return response
+
+    def test_raw_fetch_success(self):
+        yaml_text = "orgs:\n  myorg:\n    repos:\n      repo1: {}\n"
+        response = self._make_response(200, yaml_text)
+        with patch.object(
+            sync_module._get_session(), "get", return_value=response,
+        ) as mock_get:
+            result = sync_module.fetch_peribolos_file("myorg")
+        assert result["orgs"]["myorg"]["repos"] == {"repo1": {}}
+        url = mock_get.call_args[0][0]
+        assert url == (
+            "https://raw.githubusercontent.com/myorg/.github"
+            "/HEAD/peribolos.yaml"
+        )
+
+    @patch.object(sync_module, "github_api_request")
+    def test_falls_back_to_contents_api(self, mock_api):
+        import base64
+
+        yaml_text = "orgs:\n  myorg:\n    repos:\n      repo1: {}\n"
+        encoded = base64.b64encode(yaml_text.encode()).decode()
+        mock_api.return_value = (200, {"content": encoded})
+        response = self._make_response(404)
+        with patch.object(
+            sync_module._get_session(), "get", return_value=response,
+        ):
+            result = sync_module.fetch_peribolos_file("myorg")
+        assert result["orgs"]["myorg"]["repos"] == {"repo1": {}}
+        endpoint = mock_api.call_args[0][0]
+        assert endpoint.endswith("/repos/myorg/.github/contents/peribolos.yaml")
+
+    @patch.object(sync_module, "github_api_request")
+    def test_both_paths_fail_exits(self, mock_api):
+        mock_api.return_value = (404, {"message": "Not Found"})
+        response = self._make_response(404)
+        with patch.object(
+            sync_module._get_session(), "get", return_value=response,
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                sync_module.fetch_peribolos_file("myorg")
+        assert exc_info.value.code == 1
+
+
 class TestExtractRepositories:
     """Tests for extract_repositories."""
 
@@ -979,6 +1989,79 @@ class TestWorkflowRefTransformComposition:
         assert "some_input: value" in result
 
 
+class TestPerThreadOutput:
+    """Tests for the _PerThreadOutput stdout proxy."""
+
+    def test_unbuffered_thread_writes_through(self):
+        import io
+
+        backing = io.StringIO()
+        proxy = sync_module._PerThreadOutput(backing)
+        proxy.write("direct\n")
+        assert backing.getvalue() == "direct\n"
+
+    def test_buffered_writes_flush_as_block(self):
+        import io
+
+        backing = io.StringIO()
+        proxy = sync_module._PerThreadOutput(backing)
+        proxy.start_buffering()
+        proxy.write("line one\n")
+        proxy.write("line two\n")
+        assert backing.getvalue() == ""
+        proxy.stop_buffering()
+        assert backing.getvalue() == "line one\nline two\n"
+
+    def test_worker_threads_do_not_interleave(self):
+        import io
+        import threading
+
+        backing = io.StringIO()
+        proxy = sync_module._PerThreadOutput(backing)
+
+        def worker(name):
+            proxy.start_buffering()
+            for i in range(5):
+                proxy.write(f"{name}:{i}\n")
+            proxy.stop_buffering()
+
+        threads = [
+            threading.Thread(target=worker, args=(f"t{n}",))
+            for n in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        lines = backing.getvalue().splitlines()
+        assert len(lines) == 20
+        # Each worker's 5 lines must appear as a contiguous block.
+        for n in range(4):
+            indices = [
+                i for i, line in enumerate(lines)
+                if line.startswith(f"t{n}:")
+            ]
+            assert indices == list(range(indices[0], indices[0] + 5))
+
+
+class TestParseArgs:
+    """Tests for parse_args."""
+
+    def test_jobs_default(self):
+        with patch.object(sys, "argv", ["prog", "--org", "complytime"]):
+            args = sync_module.parse_args()
+        assert args.jobs == sync_module.DEFAULT_JOBS
+        assert args.jobs >= 1
+
+    def test_jobs_override(self):
+        with patch.object(
+            sys, "argv", ["prog", "--org", "complytime", "--jobs", "2"],
+        ):
+            args = sync_module.parse_args()
+        assert args.jobs == 2
+
+
 class TestWriteStepSummary:
     """Tests for write_step_summary."""
 